@@ -10,15 +10,19 @@ Features:
 - Merge new entries from upstream
 """
 
+import io
+import os
 import re
+import mmap
 import argparse
 import subprocess
-import tempfile
-import shutil
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from functools import lru_cache
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
 
 
 # Status emoji mapping
@@ -31,58 +35,197 @@ STATUS_EMOJI = {
     'REDIRECT TO TOR': '🟡',
 }
 
+# Column width caps: Name, Status, User:Pass, Channel, RSS
+MAX_COLUMN_WIDTHS = [60, 15, 50, 80, 30]
+
+# Files at least this large are memory-mapped instead of read whole
+MMAP_THRESHOLD = 256 * 1024
+
+# Below this much total input, process startup costs more than the work
+# itself (tables process at ~40 MB/s; a worker pool takes 10-40 ms to start)
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
 # Files to skip during processing
 SKIP_FILES = {'readme.md', 'license', 'license.md'}
 
+# Precompiled patterns
+_EXPIRED_RE = re.compile(r'OFFLINE|EXPIRED', re.IGNORECASE)
+_ANY_EMOJI_RE = re.compile('|'.join(map(re.escape, dict.fromkeys(STATUS_EMOJI.values()))))
+
+
+def _read_fast(filepath: Path) -> str:
+    """Read a UTF-8 text file with a single exact-size read"""
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 1))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    
+    content = b''.join(chunks).decode('utf-8')
+    # Match text-mode universal newline handling
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _write_fast(filepath: Path, content: str):
+    """Write a UTF-8 text file: one encode, one binary write, no text layer"""
+    Path(filepath).write_bytes(content.encode('utf-8'))
+
 
 def parse_markdown_table(content: str) -> Tuple[List[str], List[List[str]], str, str]:
     """
     Parse markdown table and return headers, rows, and surrounding content.
     Returns: (headers, rows, content_before_table, content_after_table)
     """
-    lines = content.split('\n')
-    
-    # Find table start and end
+    headers = []
+    rows = []
     table_start = -1
     table_end = -1
-    
-    for i, line in enumerate(lines):
-        if '|' in line and table_start == -1:
-            table_start = i
-        elif table_start != -1 and '|' not in line.strip():
-            table_end = i
+    line_no = 0
+    pos = 0
+    length = len(content)
+    
+    # Walk the content line by line without materializing a line list
+    while pos <= length:
+        nl = content.find('\n', pos)
+        if nl == -1:
+            nl = length
+        line = content[pos:nl]
+        
+        if table_start == -1:
+            if '|' in line:
+                table_start = pos
+                # Parse headers
+                headers = [h.strip() for h in line.split('|') if h.strip()]
+                line_no = 1
+        elif '|' not in line:
+            table_end = pos
             break
+        else:
+            # Parse rows (skip separator line)
+            if line_no >= 2 and line.strip():
+                cells = [c.strip() for c in line.split('|')]
+                # Remove empty first and last elements (from leading/trailing |)
+                if cells and cells[0] == '':
+                    cells = cells[1:]
+                if cells and cells[-1] == '':
+                    cells = cells[:-1]
+                if cells:
+                    rows.append(cells)
+            line_no += 1
+        
+        pos = nl + 1
     
     if table_start == -1:
         return [], [], content, ""
     
-    if table_end == -1:
-        table_end = len(lines)
+    # Slice surrounding content straight from the original string
+    content_before = content[:max(table_start - 1, 0)]
+    content_after = content[table_end:] if table_end != -1 else ""
     
-    content_before = '\n'.join(lines[:table_start])
-    content_after = '\n'.join(lines[table_end:])
+    return headers, rows, content_before, content_after
+
+
+def _find_table_bounds(buf) -> Tuple[int, int]:
+    """
+    Locate the first table in a bytes-like buffer (e.g. an mmap).
+    Returns: (start, end) offsets of the table lines; start is -1 if there is
+    no table, end is -1 if the table runs to the end of the buffer
+    """
+    first_pipe = buf.find(b'|')
+    if first_pipe == -1:
+        return -1, -1
     
-    table_lines = lines[table_start:table_end]
+    start = buf.rfind(b'\n', 0, first_pipe) + 1
+    length = len(buf)
+    pos = start
     
-    # Parse headers
-    headers = [h.strip() for h in table_lines[0].split('|') if h.strip()]
+    while pos <= length:
+        nl = buf.find(b'\n', pos)
+        if nl == -1:
+            nl = length
+        if buf.find(b'|', pos, nl) == -1:
+            return start, pos
+        pos = nl + 1
     
-    # Parse rows (skip separator line)
-    rows = []
-    for line in table_lines[2:]:  # Skip header and separator
-        if line.strip():
-            cells = [c.strip() for c in line.split('|')]
-            # Remove empty first and last elements (from leading/trailing |)
-            if cells and cells[0] == '':
-                cells = cells[1:]
-            if cells and cells[-1] == '':
-                cells = cells[:-1]
-            if cells:
-                rows.append(cells)
+    return start, -1
+
+
+def _parse_markdown_table_bytes(buf) -> Tuple[List[str], List[List[str]], str, str]:
+    """
+    Bytes-mode parse_markdown_table: only the regions actually returned are
+    decoded, and the table itself is parsed from its own slice.
+    """
+    start, end = _find_table_bounds(buf)
+    if start == -1:
+        return [], [], buf[:].decode('utf-8'), ""
+    
+    stop = end if end != -1 else len(buf)
+    headers, rows, _, _ = parse_markdown_table(buf[start:stop].decode('utf-8'))
+    
+    content_before = buf[:max(start - 1, 0)].decode('utf-8')
+    content_after = buf[end:].decode('utf-8') if end != -1 else ""
     
     return headers, rows, content_before, content_after
 
 
+def _load_large_markdown_table(filepath: Path) -> Optional[Tuple]:
+    """Parse a large markdown file through mmap; None if it needs text mode"""
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # CR line endings need text-mode newline translation
+        if mm.find(b'\r') != -1:
+            return None
+        return _parse_markdown_table_bytes(mm)
+
+
+def _read_table_text(filepath: Path) -> str:
+    """
+    Return text containing the file's first table. Large files are
+    memory-mapped and only the table region is decoded.
+    """
+    if os.path.getsize(filepath) < MMAP_THRESHOLD:
+        return _read_fast(filepath)
+    
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(b'\r') == -1:
+            start, end = _find_table_bounds(mm)
+            if start == -1:
+                return ""
+            return mm[start:end if end != -1 else len(mm)].decode('utf-8')
+    
+    return _read_fast(filepath)
+
+
+def load_markdown_table(filepath: Path,
+                        cache: Optional[Dict[Path, Tuple]] = None
+                        ) -> Tuple[List[str], List[List[str]], str, str]:
+    """
+    Read and parse a markdown file, reusing a previous parse from cache.
+    Returns: (headers, rows, content_before_table, content_after_table)
+    """
+    if cache is not None and filepath in cache:
+        return cache[filepath]
+    
+    parsed = None
+    if os.path.getsize(filepath) >= MMAP_THRESHOLD:
+        parsed = _load_large_markdown_table(filepath)
+    if parsed is None:
+        parsed = parse_markdown_table(_read_fast(filepath))
+    
+    if cache is not None:
+        cache[filepath] = parsed
+    return parsed
+
+
 def find_status_column(headers: List[str]) -> int:
     """Find the index of the Status column"""
     for i, header in enumerate(headers):
@@ -97,18 +240,13 @@ def filter_expired_rows(rows: List[List[str]], status_col: int,
     if status_col == -1:
         return rows
     
-    filtered = []
-    for row in rows:
-        if len(row) > status_col:
-            status = row[status_col].upper().strip()
-            # Remove any emoji prefixes for comparison
-            status_clean = re.sub(r'^[🟢🔴⚪🔵🟡]\s*', '', status)
-            
-            if keep_offline:
-                filtered.append(row)
-            # Check if status starts with or contains OFFLINE/EXPIRED
-            elif not any(s in status_clean for s in ['OFFLINE', 'EXPIRED']):
-                filtered.append(row)
+    if keep_offline:
+        return [row for row in rows if len(row) > status_col]
+    
+    # Drop rows whose status mentions OFFLINE/EXPIRED (emoji prefixes are
+    # irrelevant to a substring match, so no normalization is needed)
+    filtered = [row for row in rows
+                if len(row) > status_col and not _EXPIRED_RE.search(row[status_col])]
     
     return filtered
 
@@ -125,21 +263,63 @@ def calculate_column_widths(headers: List[str], rows: List[List[str]],
                 cell_width = min(len(cell), max_width)
                 widths[i] = max(widths[i], cell_width)
     
-    # Cap widths at reasonable maximums
-    max_widths = [60, 15, 50, 80, 30]  # Name, Status, User:Pass, Channel, RSS
+    return _cap_column_widths(widths)
+
+
+def _cap_column_widths(widths: List[int]) -> List[int]:
+    """Cap widths at reasonable maximums"""
     for i, w in enumerate(widths):
-        if i < len(max_widths):
-            widths[i] = min(w, max_widths[i])
+        if i < len(MAX_COLUMN_WIDTHS):
+            widths[i] = min(w, MAX_COLUMN_WIDTHS[i])
     
     return widths
 
 
+def prepare_table_rows(headers: List[str], rows: List[List[str]],
+                       status_col: int, clean: bool = True,
+                       keep_offline: bool = False, add_emoji: bool = True,
+                       max_width: int = 80) -> Tuple[List[List[str]], List[int]]:
+    """
+    Filter, emoji-annotate and measure rows in a single pass.
+    Equivalent to filter_expired_rows + add_status_emoji + calculate_column_widths.
+    Returns: (kept_rows, column_widths)
+    """
+    widths = [len(h) for h in headers]
+    num_widths = len(widths)
+    has_status = status_col != -1
+    drop_expired = clean and has_status and not keep_offline
+    annotate = add_emoji and has_status
+    kept = []
+    
+    for row in rows:
+        if has_status:
+            if len(row) > status_col:
+                status = row[status_col]
+                if drop_expired and _EXPIRED_RE.search(status):
+                    continue
+                if annotate:
+                    row[status_col] = add_status_emoji(status)
+            elif clean:
+                continue
+        
+        for i, cell in enumerate(row[:num_widths]):
+            # Limit cell width consideration
+            cell_width = min(len(cell), max_width)
+            if cell_width > widths[i]:
+                widths[i] = cell_width
+        
+        kept.append(row)
+    
+    return kept, _cap_column_widths(widths)
+
+
+@lru_cache(maxsize=128)
 def add_status_emoji(status: str) -> str:
     """Add emoji indicator to status if not already present"""
     status_clean = status.strip().upper()
     
     # Check if already has emoji
-    if any(emoji in status for emoji in STATUS_EMOJI.values()):
+    if _ANY_EMOJI_RE.search(status):
         return status
     
     # Extract the base status
@@ -153,100 +333,96 @@ def add_status_emoji(status: str) -> str:
 def rebuild_markdown_table(headers: List[str], rows: List[List[str]],
                           content_before: str, content_after: str,
                           beautify: bool = True,
-                          add_emoji: bool = True) -> str:
-    """Rebuild markdown content with formatted table"""
+                          add_emoji: bool = True,
+                          widths: Optional[List[int]] = None) -> str:
+    """
+    Rebuild markdown content with formatted table.
+    Pass widths from prepare_table_rows to skip re-annotating the rows.
+    """
     if not rows:
         return content_before + content_after
     
-    # Calculate column widths
-    widths = calculate_column_widths(headers, rows)
-    
-    # Process rows - add emoji to status if requested
-    status_col = find_status_column(headers)
-    if add_emoji and status_col != -1:
-        for row in rows:
-            if len(row) > status_col:
-                row[status_col] = add_status_emoji(row[status_col])
-        # Recalculate widths after adding emoji
+    if widths is None:
+        # Process rows - add emoji to status if requested
+        status_col = find_status_column(headers)
+        if add_emoji and status_col != -1:
+            for row in rows:
+                if len(row) > status_col:
+                    row[status_col] = add_status_emoji(row[status_col])
+        
+        # Calculate column widths once, after any emoji has been added
         widths = calculate_column_widths(headers, rows)
     
-    # Build table
-    table_lines = []
+    # Ensure proper spacing
+    before = content_before.rstrip()
+    after = content_after.lstrip()
+    
+    # Accumulate every fragment and join once at the end
+    parts = []
+    if before:
+        parts.extend((before, '\n\n'))
+    
+    num_headers = len(headers)
+    num_widths = len(widths)
     
     if beautify:
         # Header row with padding
-        header_cells = [h.ljust(widths[i]) if i < len(widths) else h 
+        header_cells = [h.ljust(widths[i]) if i < num_widths else h 
                        for i, h in enumerate(headers)]
-        header_row = '| ' + ' | '.join(header_cells) + ' |'
-        table_lines.append(header_row)
+        parts.extend(('| ', ' | '.join(header_cells), ' |\n'))
         
         # Separator row
-        separator_cells = ['-' * widths[i] if i < len(widths) else '---' 
-                          for i in range(len(headers))]
-        separator = '| ' + ' | '.join(separator_cells) + ' |'
-        table_lines.append(separator)
+        separator_cells = ['-' * widths[i] if i < num_widths else '---' 
+                          for i in range(num_headers)]
+        parts.extend(('| ', ' | '.join(separator_cells), ' |\n'))
         
         # Data rows
         for row in rows:
             # Ensure row has same number of columns as headers
-            while len(row) < len(headers):
-                row.append('')
+            missing = num_headers - len(row)
+            if missing > 0:
+                row.extend([''] * missing)
             
             cells = []
-            for i, cell in enumerate(row[:len(headers)]):
-                if i < len(widths):
+            for i, cell in enumerate(row[:num_headers]):
+                if i < num_widths:
+                    width = widths[i]
                     # Truncate if too long
-                    if len(cell) > widths[i]:
-                        cell = cell[:widths[i]-3] + '...'
-                    cells.append(cell.ljust(widths[i]))
+                    if len(cell) > width:
+                        cell = cell[:width-3] + '...'
+                    cells.append(cell.ljust(width))
                 else:
                     cells.append(cell)
             
-            row_str = '| ' + ' | '.join(cells) + ' |'
-            table_lines.append(row_str)
+            parts.extend(('| ', ' | '.join(cells), ' |\n'))
     else:
         # Simple format (original style)
-        header_row = '|' + '|'.join(headers) + '|'
-        table_lines.append(header_row)
-        
-        separator = '|' + '|'.join([' ------ ' for _ in headers]) + '|'
-        table_lines.append(separator)
+        parts.extend(('|', '|'.join(headers), '|\n'))
+        parts.extend(('|', '|'.join([' ------ ' for _ in headers]), '|\n'))
         
         for row in rows:
-            while len(row) < len(headers):
-                row.append('')
-            row_str = '|' + '|'.join(row[:len(headers)]) + '|'
-            table_lines.append(row_str)
-    
-    table = '\n'.join(table_lines)
-    
-    # Ensure proper spacing
-    before = content_before.rstrip()
-    after = content_after.lstrip()
+            missing = num_headers - len(row)
+            if missing > 0:
+                row.extend([''] * missing)
+            parts.extend(('|', '|'.join(row[:num_headers]), '|\n'))
     
-    result = before
-    if before:
-        result += '\n\n'
-    result += table
     if after:
-        result += '\n\n' + after
-    else:
-        result += '\n'
+        parts.extend(('\n', after))
     
-    return result
+    return ''.join(parts)
 
 
 def process_markdown_file(filepath: Path, dry_run: bool = False,
                          clean: bool = True, beautify: bool = True,
                          add_emoji: bool = True,
-                         keep_offline: bool = False) -> Dict:
+                         keep_offline: bool = False,
+                         table_cache: Optional[Dict[Path, Tuple]] = None) -> Dict:
     """Process a single markdown file"""
     print(f"\n📄 Processing: {filepath.name}")
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    headers, rows, content_before, content_after = parse_markdown_table(content)
+    headers, rows, content_before, content_after = load_markdown_table(
+        filepath, table_cache
+    )
     
     if not rows:
         print(f"   ⚠️  No table found")
@@ -262,17 +438,19 @@ def process_markdown_file(filepath: Path, dry_run: bool = False,
                                                 content_before, content_after,
                                                 beautify=beautify,
                                                 add_emoji=False)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            _write_fast(filepath, new_content)
             print(f"   ✨ Beautified table")
         return {'removed': 0, 'kept': len(rows), 'file': filepath.name}
     
     original_count = len(rows)
     
-    if clean:
-        filtered_rows = filter_expired_rows(rows, status_col, keep_offline)
-    else:
-        filtered_rows = rows
+    # Filter, add emoji and measure widths in one sweep over the rows
+    filtered_rows, widths = prepare_table_rows(
+        headers, rows, status_col,
+        clean=clean,
+        keep_offline=keep_offline,
+        add_emoji=add_emoji and not dry_run
+    )
     
     removed_count = original_count - len(filtered_rows)
     
@@ -282,15 +460,68 @@ def process_markdown_file(filepath: Path, dry_run: bool = False,
         new_content = rebuild_markdown_table(headers, filtered_rows,
                                             content_before, content_after,
                                             beautify=beautify,
-                                            add_emoji=add_emoji)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+                                            widths=widths)
+        _write_fast(filepath, new_content)
         print(f"   ✅ Updated")
     
     return {'removed': removed_count, 'kept': len(filtered_rows), 'file': filepath.name}
 
 
-def get_upstream_diff(repo_path: Path) -> Dict[str, List[List[str]]]:
+def _process_markdown_worker(task: Tuple[Path, Dict]) -> Tuple[Dict, str]:
+    """Run process_markdown_file in a worker, returning its stats and output"""
+    filepath, options = task
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        stats = process_markdown_file(filepath, **options)
+    return stats, buffer.getvalue()
+
+
+def read_upstream_files(repo_path: Path, filenames: List[str],
+                        ref: str = 'upstream/main') -> Dict[str, str]:
+    """
+    Read several files from a git ref using a single `git cat-file --batch`.
+    Returns a mapping of filename to content; missing files are omitted.
+    """
+    if not filenames:
+        return {}
+    
+    request = ''.join(f'{ref}:{name}\n' for name in filenames)
+    result = subprocess.run(
+        ['git', 'cat-file', '--batch'],
+        cwd=repo_path,
+        input=request.encode('utf-8'),
+        capture_output=True
+    )
+    
+    if result.returncode != 0:
+        return {}
+    
+    out = result.stdout
+    contents = {}
+    pos = 0
+    
+    for name in filenames:
+        nl = out.find(b'\n', pos)
+        if nl == -1:
+            break
+        header = out[pos:nl].rsplit(b' ', 2)
+        pos = nl + 1
+        
+        # "<object> missing" / "<object> ambiguous" carry no payload
+        if len(header) != 3 or not header[2].isdigit():
+            continue
+        
+        size = int(header[2])
+        if header[1] == b'blob':
+            contents[name] = out[pos:pos + size].decode('utf-8')
+        pos += size + 1  # payload is followed by a newline
+    
+    return contents
+
+
+def get_upstream_diff(repo_path: Path,
+                      table_cache: Optional[Dict[Path, Tuple]] = None
+                      ) -> Dict[str, List[List[str]]]:
     """Get new entries from upstream that aren't in local"""
     print("\n🔄 Fetching upstream changes...")
     
@@ -308,59 +539,58 @@ def get_upstream_diff(repo_path: Path) -> Dict[str, List[List[str]]]:
     
     new_entries = {}
     
-    # Create temp directory for upstream files
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-        
-        # Get list of markdown files
-        md_files = list(repo_path.glob("*.md"))
-        md_files = [f for f in md_files if f.name.lower() not in SKIP_FILES]
-        
-        for md_file in md_files:
-            # Get upstream version of file
-            result = subprocess.run(
-                ['git', 'show', f'upstream/main:{md_file.name}'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode != 0:
-                continue
-            
-            upstream_content = result.stdout
-            
-            # Parse both versions
-            local_headers, local_rows, _, _ = parse_markdown_table(
-                md_file.read_text(encoding='utf-8')
-            )
-            upstream_headers, upstream_rows, _, _ = parse_markdown_table(
-                upstream_content
-            )
-            
-            if not local_rows or not upstream_rows:
-                continue
-            
-            # Find new entries (compare first column - typically Name/URL)
-            local_keys = {row[0] if row else '' for row in local_rows}
-            
-            new_rows = []
-            for row in upstream_rows:
-                if row and row[0] not in local_keys:
-                    new_rows.append(row)
-            
-            if new_rows:
-                new_entries[md_file.name] = {
-                    'headers': upstream_headers,
-                    'new_rows': new_rows
-                }
+    # Get list of markdown files
+    md_files = list(repo_path.glob("*.md"))
+    md_files = [f for f in md_files if f.name.lower() not in SKIP_FILES]
+    
+    # Read every upstream version in one git process
+    upstream_files = read_upstream_files(
+        repo_path, [md_file.name for md_file in md_files]
+    )
+    
+    for md_file in md_files:
+        upstream_content = upstream_files.get(md_file.name)
+        
+        if upstream_content is None:
+            continue
+        
+        # Parse both versions
+        local_headers, local_rows, _, _ = load_markdown_table(
+            md_file, table_cache
+        )
+        upstream_headers, upstream_rows, _, _ = parse_markdown_table(
+            upstream_content
+        )
+        
+        if not local_rows or not upstream_rows:
+            continue
+        
+        # Find new entries (compare first column - typically Name/URL)
+        local_keys = {row[0] if row else '' for row in local_rows}
+        
+        new_rows = []
+        for row in upstream_rows:
+            if row and row[0] not in local_keys:
+                new_rows.append(row)
+        
+        if new_rows:
+            new_entries[md_file.name] = {
+                'headers': upstream_headers,
+                'new_rows': new_rows
+            }
     
     return new_entries
 
 
-def merge_upstream_entries(repo_path: Path, dry_run: bool = False) -> Dict:
+def _row_sort_key(row: List[str]) -> str:
+    """Sort key for table rows: case-insensitive first column"""
+    return row[0].lower() if row else ''
+
+
+def merge_upstream_entries(repo_path: Path, dry_run: bool = False,
+                           table_cache: Optional[Dict[Path, Tuple]] = None) -> Dict:
     """Merge new entries from upstream into local files"""
-    new_entries = get_upstream_diff(repo_path)
+    new_entries = get_upstream_diff(repo_path, table_cache)
     
     if not new_entries:
         print("   ✅ No new entries from upstream")
@@ -378,14 +608,15 @@ def merge_upstream_entries(repo_path: Path, dry_run: bool = False) -> Dict:
         
         if not dry_run:
             # Read current file
-            content = filepath.read_text(encoding='utf-8')
-            headers, rows, content_before, content_after = parse_markdown_table(content)
+            headers, rows, content_before, content_after = load_markdown_table(
+                filepath, table_cache
+            )
             
             # Add new rows
             rows.extend(new_rows)
             
             # Sort by first column (name)
-            rows.sort(key=lambda x: x[0].lower() if x else '')
+            rows.sort(key=_row_sort_key)
             
             # Rebuild table
             new_content = rebuild_markdown_table(headers, rows,
@@ -393,13 +624,76 @@ def merge_upstream_entries(repo_path: Path, dry_run: bool = False) -> Dict:
                                                 beautify=True,
                                                 add_emoji=True)
             
-            filepath.write_text(new_content, encoding='utf-8')
+            _write_fast(filepath, new_content)
+            if table_cache is not None:
+                # Keep the cache in step with what is now on disk
+                table_cache[filepath] = parse_markdown_table(new_content)
             files_updated.append(filename)
             print(f"   ✅ Merged")
     
     return {'total_new': total_new, 'files': files_updated}
 
 
+@lru_cache(maxsize=None)
+def _status_cell_re(status_col: int) -> re.Pattern:
+    """Compile a pattern capturing only the given cell of a table row"""
+    # Consume a leading '|' if present (otherwise assert there isn't one, so
+    # the match can't backtrack into treating it as an empty first cell)
+    return re.compile(r'^(?:\s*\||(?!\s*\|))' + r'[^|]*\|' * status_col + r'([^|]*)')
+
+
+def _count_statuses(content: str) -> Tuple[int, int, int]:
+    """
+    Count table rows by status without building the row cells.
+    Matches parse_markdown_table's notion of a row.
+    Returns: (total, online, offline)
+    """
+    total = online = offline = 0
+    status_col = -1
+    line_no = -1
+    pos = 0
+    length = len(content)
+    
+    while pos <= length:
+        nl = content.find('\n', pos)
+        if nl == -1:
+            nl = length
+        line = content[pos:nl]
+        pos = nl + 1
+        
+        if '|' not in line:
+            if line_no != -1:
+                break
+            continue
+        
+        line_no += 1
+        if line_no == 0:
+            headers = [h.strip() for h in line.split('|') if h.strip()]
+            status_col = find_status_column(headers)
+            if status_col != -1:
+                status_re = _status_cell_re(status_col)
+            continue
+        # Skip the separator, and lines that parse to no cells
+        if line_no == 1 or line.strip() == '|':
+            continue
+        
+        total += 1
+        if status_col == -1:
+            continue
+        
+        match = status_re.match(line)
+        if not match:
+            continue
+        
+        status = match.group(1).upper()
+        if 'ONLINE' in status or 'VALID' in status:
+            online += 1
+        elif 'OFFLINE' in status or 'EXPIRED' in status:
+            offline += 1
+    
+    return total, online, offline
+
+
 def generate_statistics(repo_path: Path) -> Dict:
     """Generate statistics about the repository"""
     stats = {
@@ -407,44 +701,32 @@ def generate_statistics(repo_path: Path) -> Dict:
         'online_entries': 0,
         'offline_entries': 0,
         'files': {},
-        'by_type': defaultdict(int)
+        'by_type': Counter()
     }
     
     md_files = list(repo_path.glob("*.md"))
     md_files = [f for f in md_files if f.name.lower() not in SKIP_FILES]
     
     for md_file in md_files:
-        content = md_file.read_text(encoding='utf-8')
-        headers, rows, _, _ = parse_markdown_table(content)
+        total, online, offline = _count_statuses(_read_table_text(md_file))
         
-        if not rows:
+        if not total:
             continue
         
-        status_col = find_status_column(headers)
-        
         file_stats = {
-            'total': len(rows),
-            'online': 0,
-            'offline': 0
+            'total': total,
+            'online': online,
+            'offline': offline
         }
         
-        for row in rows:
-            stats['total_entries'] += 1
-            
-            if status_col != -1 and len(row) > status_col:
-                status = row[status_col].upper()
-                if 'ONLINE' in status or 'VALID' in status:
-                    file_stats['online'] += 1
-                    stats['online_entries'] += 1
-                elif 'OFFLINE' in status or 'EXPIRED' in status:
-                    file_stats['offline'] += 1
-                    stats['offline_entries'] += 1
-        
+        stats['total_entries'] += total
+        stats['online_entries'] += online
+        stats['offline_entries'] += offline
         stats['files'][md_file.name] = file_stats
         
         # Categorize by file type
         category = md_file.stem.replace('_', ' ').title()
-        stats['by_type'][category] = file_stats['total']
+        stats['by_type'][category] += total
     
     return stats
 
@@ -558,10 +840,15 @@ Examples:
     if args.dry_run:
         print("⚠️  DRY RUN MODE - No changes will be made")
     
+    # Share parsed tables between sync and clean/beautify so each file is
+    # read and parsed only once per run
+    table_cache = {} if args.sync and (args.clean or args.beautify) else None
+    
     # Sync from upstream first
     if args.sync:
         print("\n🔄 SYNCING FROM UPSTREAM")
-        result = merge_upstream_entries(repo, dry_run=args.dry_run)
+        result = merge_upstream_entries(repo, dry_run=args.dry_run,
+                                        table_cache=table_cache)
         print(f"\n📊 Sync complete: {result['total_new']} new entries added")
     
     # Process files
@@ -579,19 +866,35 @@ Examples:
         total_removed = 0
         total_kept = 0
         
+        tasks = []
         for md_file in sorted(md_files):
             if not md_file.exists():
                 print(f"\n❌ File not found: {md_file}")
                 continue
-                
-            stats = process_markdown_file(
-                md_file,
-                dry_run=args.dry_run,
-                clean=args.clean,
-                beautify=args.beautify,
-                add_emoji=add_emoji,
-                keep_offline=args.keep_offline
-            )
+            
+            options = {
+                'dry_run': args.dry_run,
+                'clean': args.clean,
+                'beautify': args.beautify,
+                'add_emoji': add_emoji,
+                'keep_offline': args.keep_offline,
+            }
+            # Hand each worker only its own cached table, if any
+            if table_cache is not None and md_file in table_cache:
+                options['table_cache'] = {md_file: table_cache[md_file]}
+            tasks.append((md_file, options))
+        
+        # Files are independent, so process large batches across CPU cores
+        workers = min(len(tasks), os.cpu_count() or 1)
+        total_bytes = sum(md_file.stat().st_size for md_file, _ in tasks)
+        if workers > 1 and total_bytes >= PARALLEL_MIN_BYTES:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(_process_markdown_worker, tasks))
+        else:
+            outcomes = [_process_markdown_worker(task) for task in tasks]
+        
+        for stats, output in outcomes:
+            print(output, end='')
             total_removed += stats['removed']
             total_kept += stats['kept']
         
@@ -6,8 +6,8 @@ Usage:
   # First time setup (generates session file):
   python3 telegram_monitor.py --setup
   
-  # Check channels and update markdown:
-  python3 telegram_monitor.py --check
+  # Check channels and update markdown (several files share one connection):
+  python3 telegram_monitor.py --check telegram_threat_actors.md others.md
   
   # Export session for GitHub Actions:
   python3 telegram_monitor.py --export-session
@@ -17,12 +17,19 @@ import os
 import re
 import sys
 import json
+import heapq
+import time
+import shutil
+import tempfile
+import random
 import base64
 import asyncio
 import argparse
+from collections import Counter
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 try:
     from telethon import TelegramClient
@@ -42,6 +49,17 @@ except ImportError:
     TELETHON_AVAILABLE = False
     print("⚠️  Telethon not installed. Run: pip install telethon")
 
+try:
+    import orjson
+
+    def _json_bytes(obj) -> bytes:
+        """Serialize obj as indented JSON"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_bytes(obj) -> bytes:
+        """Serialize obj as indented JSON"""
+        return json.dumps(obj, indent=2).encode('utf-8')
+
 
 # Config
 API_ID = os.environ.get('TELEGRAM_API_ID')
@@ -50,18 +68,83 @@ SESSION_NAME = 'darkwatch_session'
 SESSION_FILE = f'{SESSION_NAME}.session'
 SESSION_B64_ENV = 'TELEGRAM_SESSION_B64'
 
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read an integer setting from the environment, clamped to minimum"""
+    try:
+        value = int(os.environ.get(name, default))
+    except ValueError:
+        print(f"⚠️  Ignoring invalid {name}={os.environ[name]!r}, using {default}")
+        value = default
+    return max(value, minimum)
+
+
 # Rate limiting
-CHECK_DELAY = 5  # seconds between checks to avoid flood
+CHECK_RATE = 0.5  # checks started per second across all workers (30/min)
+CHECK_CONCURRENCY = _env_int('TG_CONCURRENCY', 16)  # max checks in flight
 MAX_FLOOD_WAIT = 300  # max seconds to wait for flood (5 min)
 MAX_RETRIES = 2  # max retries per URL
+MAX_CONSECUTIVE_FLOODS = 3  # FLOOD results in a row before giving up on the run
+
+# Result cache, so re-runs skip channels checked recently
+CACHE_FILE = '.tg_cache.json'
+CACHE_TTL = {  # seconds a result stays fresh, by status
+    'ONLINE': 6 * 3600,
+    'VALID': 6 * 3600,
+    'OFFLINE': 24 * 3600,
+    'EXPIRED': 24 * 3600,
+    'ERROR': 3600,
+}
+_cache: Dict[str, Dict] = {}
+
+# Status emoji mapping
+STATUS_EMOJI = {
+    'ONLINE': '🟢',
+    'VALID': '🟢',
+    'OFFLINE': '🔴',
+    'EXPIRED': '🔴',
+    'ERROR': '🟡',
+    'FLOOD': '🟡',
+    'SEIZED': '🔵',
+}
+
+# Status cell text written to markdown, e.g. '🟢 ONLINE'
+STATUS_LABELS = {status: f'{emoji} {status}' for status, emoji in STATUS_EMOJI.items()}
+
+# Precompiled URL patterns
+_HTTP_SCHEME_RE = re.compile(r'^http://', re.IGNORECASE)
+_TELEGRAM_ME_HOST_RE = re.compile(r'^(https?://)?(telegram\.me)', re.IGNORECASE)
+_TME_HOST_RE = re.compile(r'^(https?://)?(t\.me)', re.IGNORECASE)
+_TME_COMBINED_RE = re.compile(
+    r't\.me/(?:'
+    r'\+(?P<plus>[a-zA-Z0-9_-]+)'                # t.me/+XXXXX
+    r'|joinchat/(?P<joinchat>[a-zA-Z0-9_-]+)'    # t.me/joinchat/XXXXX
+    r'|c/(?P<private>\d+)/\d+'                   # t.me/c/<chat_id>/<message_id>
+    r'|(?P<channel>[a-zA-Z0-9_]+)(?:\?|$|/)'     # t.me/channelname
+    r')',
+    re.IGNORECASE
+)
+_TME_URL_RE = re.compile(r'https?://t\.me/[^\s\)\]|>]+')
+_TME_URL_BYTES_RE = re.compile(rb'https?://t\.me/[^\s\)\]|>]+')  # superset of _TME_URL_RE
+
+# Which URL type each named group of _TME_COMBINED_RE stands for
+_TME_GROUP_TYPES = {
+    'plus': 'invite',
+    'joinchat': 'invite',
+    'private': 'private',
+    'channel': 'channel',
+}
+
+# t.me paths that look like usernames but aren't channels
+_RESERVED_USERNAMES = frozenset({'joinchat', 'addstickers', 'share'})
 
 
 def normalize_telegram_url(url: str) -> str:
     """Normalize Telegram URLs so matching against markdown is reliable"""
     cleaned = url.strip()
-    cleaned = re.sub(r'^http://', 'https://', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'^(https?://)?(telegram\.me)', r'https://t.me', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'^(https?://)?(t\.me)', r'https://t.me', cleaned, flags=re.IGNORECASE)
+    cleaned = _HTTP_SCHEME_RE.sub('https://', cleaned)
+    cleaned = _TELEGRAM_ME_HOST_RE.sub('https://t.me', cleaned)
+    cleaned = _TME_HOST_RE.sub('https://t.me', cleaned)
     cleaned = cleaned.rstrip('/')
     return cleaned
 
@@ -73,40 +156,141 @@ def parse_telegram_url(url: str) -> Tuple[Optional[str], Optional[str]]:
     """
     url = normalize_telegram_url(url)
 
-    # Private invite link: t.me/+XXXXX or t.me/joinchat/XXXXX
-    invite_match = re.search(r't\.me/\+([a-zA-Z0-9_-]+)', url, re.IGNORECASE)
-    if invite_match:
-        return 'invite', invite_match.group(1)
+    # One scan; alternatives are tried in priority order at each position
+    match = _TME_COMBINED_RE.search(url)
+    if not match:
+        return None, None
     
-    invite_match = re.search(r't\.me/joinchat/([a-zA-Z0-9_-]+)', url, re.IGNORECASE)
-    if invite_match:
-        return 'invite', invite_match.group(1)
-
-    # Private message link: t.me/c/<chat_id>/<message_id>
-    private_match = re.search(r't\.me/c/(\d+)/\d+', url, re.IGNORECASE)
-    if private_match:
-        return 'private', private_match.group(1)
+    url_type = _TME_GROUP_TYPES[match.lastgroup]
+    identifier = match.group(match.lastgroup)
     
-    # Public channel/group: t.me/channelname
-    channel_match = re.search(r't\.me/([a-zA-Z0-9_]+)(?:\?|$|/)', url, re.IGNORECASE)
-    if channel_match:
-        username = channel_match.group(1)
-        if username.lower() not in ['joinchat', 'addstickers', 'share']:
-            return 'channel', username
+    # Some t.me paths look like channel names but aren't
+    if url_type == 'channel' and identifier.lower() in _RESERVED_USERNAMES:
+        return None, None
     
-    return None, None
+    return url_type, identifier
+
+
+class TelegramLink(NamedTuple):
+    """A Telegram URL, parsed once and reused through check and update"""
+    url: str
+    url_type: Optional[str]
+    identifier: Optional[str]
+    lines: Tuple[int, ...] = ()  # markdown lines where this is the first URL
+
+
+def make_telegram_link(url: str, lines: Tuple[int, ...] = ()) -> TelegramLink:
+    """Parse a URL into a TelegramLink"""
+    url_type, identifier = parse_telegram_url(url)
+    return TelegramLink(url, url_type, identifier, tuple(lines))
+
+
+def _link_target(link: TelegramLink) -> Tuple[Optional[str], str]:
+    """What a link points at; links sharing a target need only one check"""
+    if link.url_type is None:
+        return None, link.url
+    if link.url_type == 'channel':
+        return link.url_type, link.identifier.lower()  # usernames ignore case
+    return link.url_type, link.identifier
+
 
+def _cache_key(link: TelegramLink) -> str:
+    """Result cache key; one entry per target, whatever the URL spelling"""
+    url_type, target = _link_target(link)
+    return f'{url_type}:{target}'
 
-async def check_invite_link(client: 'TelegramClient', invite_hash: str, retry: int = 0) -> Dict:
+
+class RateLimiter:
+    """
+    Token bucket limiting how often checks may start.
+    pause() closes a shared gate so every waiting check backs off together.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._open = asyncio.Event()
+        self._open.set()
+        self._resume_at = 0.0
+        self._reopen_task = None
+
+    def pause(self, seconds: float):
+        """Hold all acquire() calls for `seconds`, e.g. after a FloodWaitError"""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+        self._open.clear()
+        if self._reopen_task is None or self._reopen_task.done():
+            self._reopen_task = asyncio.get_running_loop().create_task(self._reopen())
+
+    async def _reopen(self):
+        """Re-open the gate once the latest pause has elapsed"""
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        self._open.set()
+
+    async def acquire(self):
+        """Wait until the gate is open and a token is available, then take it"""
+        async with self._lock:
+            while True:
+                await self._open.wait()
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+async def _flood_backoff(seconds: float, limiter: Optional[RateLimiter] = None):
+    """Wait out a flood ban, pausing every other check on the shared limiter"""
+    if limiter is None:
+        await asyncio.sleep(seconds)
+        return
+    limiter.pause(seconds)
+    await limiter.acquire()
+
+
+async def with_flood_retry(check, *args, limiter: Optional[RateLimiter] = None,
+                           max_tries: int = MAX_RETRIES + 1) -> Dict:
+    """
+    Await check(*args), backing off and retrying on FloodWaitError.
+    Returns a FLOOD result once the wait is too long or tries run out.
+    """
+    for attempt in range(max_tries):
+        try:
+            return await check(*args)
+        except FloodWaitError as e:
+            if e.seconds > MAX_FLOOD_WAIT or attempt == max_tries - 1:
+                return {'status': 'FLOOD', 'error': f'Rate limited for {e.seconds}s',
+                        'wait_seconds': e.seconds}
+            print(f"  ⏳ Rate limited, waiting {e.seconds}s...", flush=True)
+            await _flood_backoff(e.seconds + random.uniform(0, 1), limiter)
+
+
+async def check_invite_link(client: 'TelegramClient', invite_hash: str) -> Dict:
     """Check if an invite link is valid and get info"""
     try:
         result = await client(CheckChatInviteRequest(invite_hash))
         
         if isinstance(result, ChatInviteAlready):
-            # Already a member
+            # Already a member; chat may be any Chat* variant, so probe it
             return {
                 'status': 'VALID',
-                'title': result.chat.title if hasattr(result.chat, 'title') else 'Unknown',
+                'title': getattr(result.chat, 'title', 'Unknown'),
                 'members': getattr(result.chat, 'participants_count', None),
             }
         elif isinstance(result, ChatInvite):
@@ -122,52 +306,42 @@ async def check_invite_link(client: 'TelegramClient', invite_hash: str, retry: i
         return {'status': 'EXPIRED', 'error': 'Invite link expired'}
     except InviteHashInvalidError:
         return {'status': 'EXPIRED', 'error': 'Invalid invite hash'}
-    except FloodWaitError as e:
-        if e.seconds <= MAX_FLOOD_WAIT and retry < MAX_RETRIES:
-            print(f"\n  ⏳ Rate limited, waiting {e.seconds}s...", end=" ", flush=True)
-            await asyncio.sleep(e.seconds + 1)
-            return await check_invite_link(client, invite_hash, retry + 1)
-        return {'status': 'FLOOD', 'error': f'Rate limited for {e.seconds}s', 'wait_seconds': e.seconds}
+    except FloodWaitError:
+        raise  # handled by with_flood_retry
     except Exception as e:
         return {'status': 'ERROR', 'error': str(e)}
     
     return {'status': 'UNKNOWN'}
 
 
-async def check_public_channel(client: 'TelegramClient', username: str, retry: int = 0) -> Dict:
+async def check_public_channel(client: 'TelegramClient', username: str) -> Dict:
     """Get info for a public channel/group"""
     try:
         entity = await client.get_entity(username)
         full = await client(GetFullChannelRequest(entity))
         
+        # Channel and ChannelFull: optional TL fields are present as None
         chat = full.chats[0]
         full_chat = full.full_chat
         
-        # Get linked chat info if available
-        linked_chat_id = getattr(full_chat, 'linked_chat_id', None)
-        
         return {
             'status': 'ONLINE',
             'title': chat.title,
-            'username': getattr(chat, 'username', None),
-            'members': getattr(full_chat, 'participants_count', None),
-            'description': getattr(full_chat, 'about', None),
-            'is_channel': not getattr(chat, 'megagroup', False),
-            'is_verified': getattr(chat, 'verified', False),
-            'is_scam': getattr(chat, 'scam', False),
-            'is_fake': getattr(chat, 'fake', False),
-            'is_restricted': getattr(chat, 'restricted', False),
-            'linked_chat_id': linked_chat_id,
-            'admins_count': getattr(full_chat, 'admins_count', None),
-            'banned_count': getattr(full_chat, 'banned_count', None),
-            'online_count': getattr(full_chat, 'online_count', None),
+            'username': chat.username,
+            'members': full_chat.participants_count,
+            'description': full_chat.about,
+            'is_channel': not chat.megagroup,
+            'is_verified': chat.verified,
+            'is_scam': chat.scam,
+            'is_fake': getattr(chat, 'fake', False),  # newer layers only
+            'is_restricted': chat.restricted,
+            'linked_chat_id': full_chat.linked_chat_id,
+            'admins_count': full_chat.admins_count,
+            'banned_count': full_chat.banned_count,
+            'online_count': full_chat.online_count,
         }
-    except FloodWaitError as e:
-        if e.seconds <= MAX_FLOOD_WAIT and retry < MAX_RETRIES:
-            print(f"\n  ⏳ Rate limited, waiting {e.seconds}s...", end=" ", flush=True)
-            await asyncio.sleep(e.seconds + 1)
-            return await check_public_channel(client, username, retry + 1)
-        return {'status': 'FLOOD', 'error': f'Rate limited for {e.seconds}s', 'wait_seconds': e.seconds}
+    except FloodWaitError:
+        raise  # handled by with_flood_retry
     except Exception as e:
         error_str = str(e).lower()
         if 'username not occupied' in error_str or 'username invalid' in error_str:
@@ -175,22 +349,94 @@ async def check_public_channel(client: 'TelegramClient', username: str, retry: i
         return {'status': 'ERROR', 'error': str(e)}
 
 
-async def check_telegram_url(client: 'TelegramClient', url: str) -> Dict:
-    """Check any Telegram URL and return info"""
-    url_type, identifier = parse_telegram_url(url)
+# Checker for each URL type parse_telegram_url can return
+URL_TYPE_HANDLERS = {
+    'invite': check_invite_link,
+    'channel': check_public_channel,
+}
+
+
+def load_cache(path: str = CACHE_FILE):
+    """Load cached check results from disk, if present"""
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            _cache.update(json.load(f))
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable cache {path}: {e}")
+
+
+def save_cache(path: str = CACHE_FILE):
+    """Write still-fresh cached check results to disk"""
+    fresh = {key: entry for key, entry in _cache.items() if _is_fresh(entry)}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(fresh, f, indent=2)
+
+
+def _is_fresh(entry: Dict) -> bool:
+    """Whether a cached result is still within its status's TTL"""
+    ttl = CACHE_TTL.get(entry.get('status'))
+    if not ttl:
+        return False
+    try:
+        checked_at = datetime.fromisoformat(entry['checked_at'])
+    except (KeyError, TypeError, ValueError):
+        return False
+    age = (datetime.now(timezone.utc) - checked_at).total_seconds()
+    return age < ttl
+
+
+def _cached_result(link: TelegramLink) -> Optional[Dict]:
+    """Fresh cached result for a link, if any"""
+    cached = _cache.get(_cache_key(link))
+    if cached and _is_fresh(cached):
+        return dict(cached, url=link.url, cached=True)
+    return None
+
+
+async def check_telegram_url(client: 'TelegramClient', url: Union[str, TelegramLink],
+                             limiter: Optional[RateLimiter] = None) -> Dict:
+    """Check any Telegram URL (or already-parsed TelegramLink) and return info"""
+    link = url if isinstance(url, TelegramLink) else make_telegram_link(url)
+    url_type, identifier = link.url_type, link.identifier
+    
+    cached = _cached_result(link)
+    if cached:
+        return cached
     
-    if url_type == 'invite':
-        result = await check_invite_link(client, identifier)
-    elif url_type == 'channel':
-        result = await check_public_channel(client, identifier)
+    handler = URL_TYPE_HANDLERS.get(url_type)
+    if handler:
+        result = await with_flood_retry(handler, client, identifier, limiter=limiter)
     else:
         result = {'status': 'INVALID', 'error': 'Could not parse URL'}
     
-    result['url'] = url
+    result['url'] = link.url
     result['checked_at'] = datetime.now(timezone.utc).isoformat()
+    if result['status'] in CACHE_TTL:
+        _cache[_cache_key(link)] = result
     return result
 
 
+def _validate_session_file(path: str) -> bool:
+    """Check that a session file opens as SQLite and holds a session row"""
+    import sqlite3
+    try:
+        conn = sqlite3.connect(path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM sessions')
+        rows = cursor.fetchall()
+        conn.close()
+        if not rows:
+            print("❌ Session file has no session data")
+            return False
+    except sqlite3.Error as e:
+        print(f"❌ Session file corrupted: {e}")
+        os.remove(path)
+        return False
+    return True
+
+
 def load_session_from_env() -> bool:
     """Load session from base64 environment variable"""
     session_b64 = os.environ.get(SESSION_B64_ENV)
@@ -219,19 +465,7 @@ def load_session_from_env() -> bool:
             f.write(session_data)
         
         # Verify the file is readable
-        import sqlite3
-        try:
-            conn = sqlite3.connect(SESSION_FILE)
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM sessions')
-            rows = cursor.fetchall()
-            conn.close()
-            if not rows:
-                print("❌ Session file has no session data")
-                return False
-        except sqlite3.Error as e:
-            print(f"❌ Session file corrupted: {e}")
-            os.remove(SESSION_FILE)
+        if not _validate_session_file(SESSION_FILE):
             return False
         
         print(f"✅ Session loaded from {SESSION_B64_ENV} ({len(session_data)} bytes)")
@@ -285,11 +519,11 @@ async def setup_session():
     return True
 
 
-async def run_checks(urls: List[str], output_file: Optional[str] = None):
-    """Check multiple Telegram URLs"""
+def ensure_session() -> bool:
+    """Make sure credentials and a session file are available for checks"""
     if not API_ID or not API_HASH:
         print("❌ Set TELEGRAM_API_ID and TELEGRAM_API_HASH")
-        return []
+        return False
     
     # Try to load session from env
     session_loaded = load_session_from_env()
@@ -300,72 +534,279 @@ async def run_checks(urls: List[str], output_file: Optional[str] = None):
             print(f"   Check that the secret is set in GitHub Actions")
         else:
             print("❌ No session file. Run --setup first")
-        return []
+        return False
     
-    results = []
-    client = TelegramClient(SESSION_NAME, int(API_ID), API_HASH)
+    return True
+
+
+async def ensure_session_async() -> bool:
+    """ensure_session for coroutines; the file and SQLite work runs in a thread"""
+    return await asyncio.to_thread(ensure_session)
+
+
+class TelegramMonitor:
+    """
+    Keeps one connected TelegramClient (and one rate limiter) alive for any
+    number of check runs, so the MTProto handshake is paid once.
     
-    try:
-        await client.connect()
-        if not await client.is_user_authorized():
-            print("❌ Session expired. Run --setup again")
-            return []
+        async with TelegramMonitor() as monitor:
+            results = await monitor.check_urls(urls)
+    """
+
+    def __init__(self, session_name: str = SESSION_NAME, use_cache: bool = True):
+        self.session_name = session_name
+        self.use_cache = use_cache
+        self.client = None
+        self.limiter = None
+
+    async def __aenter__(self):
+        if self.use_cache:
+            load_cache()
+        self.client = TelegramClient(self.session_name, int(API_ID), API_HASH)
+        try:
+            await self.client.connect()
+        except BaseException:
+            # __aexit__ won't run for a failed __aenter__, so clean up here
+            await self.__aexit__(*sys.exc_info())
+            raise
+        self.limiter = RateLimiter(CHECK_RATE)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.disconnect()
+        self.client = None
+        if self.use_cache:
+            save_cache()
+        return False
+
+    async def is_authorized(self) -> bool:
+        return await self.client.is_user_authorized()
+
+    async def check_urls(self, urls: List[Union[str, TelegramLink]]) -> List[Dict]:
+        """Check URLs concurrently, bounded by CHECK_CONCURRENCY and CHECK_RATE"""
+        links = [url if isinstance(url, TelegramLink) else make_telegram_link(url)
+                 for url in urls]
+        print(f"🔍 Checking {len(links)} Telegram URLs...")
         
-        print(f"🔍 Checking {len(urls)} Telegram URLs...")
-        flood_count = 0
+        # t.me/foo, t.me/foo/42 and http://t.me/FOO resolve the same
+        # channel, so check each target once and share the result
+        targets: Dict[Tuple[Optional[str], str], TelegramLink] = {}
+        for link in links:
+            targets.setdefault(_link_target(link), link)
+        unique = list(targets.values())
         
-        for i, url in enumerate(urls):
-            print(f"  [{i+1}/{len(urls)}] {url[:50]}...", end=" ", flush=True)
-            result = await check_telegram_url(client, url)
-            results.append(result)
-            print(f"→ {result['status']}")
+        semaphore = asyncio.Semaphore(CHECK_CONCURRENCY)
+        limiter = self.limiter
+        stop = asyncio.Event()
+        consecutive_floods = 0
+        
+        async def check_one(i: int, link: TelegramLink) -> Optional[Dict]:
+            # Cache hits make no API call, so they don't wait for a token
+            result = _cached_result(link)
+            if result:
+                print(f"  [{i+1}/{len(unique)}] {link.url[:50]}... → {result['status']} (cached)")
+                return result
             
-            if result['status'] == 'FLOOD':
-                flood_count += 1
-                wait_time = result.get('wait_seconds', 60)
-                if flood_count >= 3:
-                    print(f"  ⚠️  Too many rate limits ({flood_count}), stopping")
-                    break
-                # Wait extra time after flood
-                print(f"  ⏳ Waiting {wait_time}s before continuing...")
-                await asyncio.sleep(wait_time)
-            else:
-                flood_count = 0  # Reset on success
+            async with semaphore:
+                # Skip anything still queued once we've been rate limited
+                if stop.is_set():
+                    return None
+                async with limiter:
+                    if stop.is_set():
+                        return None
+                    result = await check_telegram_url(self.client, link, limiter)
             
-            await asyncio.sleep(CHECK_DELAY)
+            nonlocal consecutive_floods
+            print(f"  [{i+1}/{len(unique)}] {link.url[:50]}... → {result['status']}")
+            if result['status'] != 'FLOOD':
+                consecutive_floods = 0
+                return result
+            
+            # Short bans are retried in place; give up on the rest of the run
+            # when Telegram asks us to wait longer than we're willing, or
+            # keeps banning us even after those retries
+            consecutive_floods += 1
+            wait_seconds = result.get('wait_seconds', 0)
+            if not stop.is_set():
+                if wait_seconds > MAX_FLOOD_WAIT:
+                    print(f"  ⚠️  Rate limited for {wait_seconds}s, stopping")
+                    stop.set()
+                elif consecutive_floods >= MAX_CONSECUTIVE_FLOODS:
+                    print(f"  ⚠️  Too many rate limits ({consecutive_floods}), stopping")
+                    stop.set()
+            return result
+        
+        outcomes = await asyncio.gather(
+            *[check_one(i, link) for i, link in enumerate(unique)],
+            return_exceptions=True
+        )
+        
+        by_target = dict(zip(targets, outcomes))
+        results = []
+        for link in links:
+            outcome = by_target[_link_target(link)]
+            if isinstance(outcome, Exception):
+                results.append({
+                    'status': 'ERROR',
+                    'error': str(outcome),
+                    'url': link.url,
+                    'checked_at': datetime.now(timezone.utc).isoformat(),
+                })
+            elif outcome is not None:
+                results.append(outcome if outcome['url'] == link.url
+                               else dict(outcome, url=link.url))
         
-    finally:
-        await client.disconnect()
+        return results
+
+
+class JsonArrayWriter:
+    """
+    Writes an indented JSON array to a file one element at a time,
+    so results never have to be collected into a list first.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._sep = b'\n  '
+
+    def __enter__(self) -> 'JsonArrayWriter':
+        self._file = open(self.path, 'wb')
+        self._file.write(b'[')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.write(b']' if self._sep == b'\n  ' else b'\n]')
+        self._file.close()
+
+    def write(self, obj):
+        self._file.write(self._sep + _json_bytes(obj).replace(b'\n', b'\n  '))
+        self._sep = b',\n  '
+
+
+def save_results(results: Iterable[Dict], output_file: str):
+    """Write check results to a JSON file"""
+    with JsonArrayWriter(output_file) as out:
+        for result in results:
+            out.write(result)
+    print(f"📁 Results saved to {output_file}")
+
+
+async def run_checks(urls: List[Union[str, TelegramLink]], output_file: Optional[str] = None,
+                     monitor: Optional[TelegramMonitor] = None,
+                     use_cache: bool = True) -> List[Dict]:
+    """
+    Check multiple Telegram URLs.
+    Pass an open TelegramMonitor to reuse its connection across calls.
+    """
+    if monitor is None:
+        if not await ensure_session_async():
+            return []
+        async with TelegramMonitor(use_cache=use_cache) as monitor:
+            return await run_checks(urls, output_file, monitor)
+    
+    if not await monitor.is_authorized():
+        print("❌ Session expired. Run --setup again")
+        return []
+    
+    results = await monitor.check_urls(urls)
     
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"📁 Results saved to {output_file}")
+        save_results(results, output_file)
     
     return results
 
 
+async def check_markdown_files(filepaths: List[str],
+                               output_file: Optional[str] = None,
+                               use_cache: bool = True) -> List[Dict]:
+    """Check and update several markdown files over one Telegram connection"""
+    if not await ensure_session_async():
+        return []
+    
+    all_results = []
+    async with TelegramMonitor(use_cache=use_cache) as monitor:
+        for filepath in filepaths:
+            # A failure on one file shouldn't skip the rest
+            try:
+                # Parse each URL once and remember which rows it belongs to
+                links = extract_telegram_links(filepath)
+                print(f"📋 Found {len(links)} Telegram URLs in {filepath}")
+                
+                results = await run_checks(links, monitor=monitor)
+                
+                # Update the markdown file with results
+                updated = update_markdown_with_results(filepath, results, links)
+                if updated:
+                    print(f"✏️  Updated {updated} entries in {filepath}")
+            except Exception as e:
+                print(f"❌ Failed to check {filepath}: {e}")
+                continue
+            
+            # Print detailed summary
+            print_results_summary(results)
+            all_results.extend(results)
+    
+    if output_file:
+        save_results(all_results, output_file)
+    
+    return all_results
+
+
+def _scan_telegram_urls(content: bytes) -> Iterator[Tuple[int, bool, str]]:
+    """
+    Yield (line_no, first_on_line, url) for every t.me URL in raw markdown.
+    Candidates come from a bytes regex so the file is never decoded; each is
+    re-matched as str, because only the str regex stops at Unicode spaces.
+    Line numbers follow text mode's universal newlines.
+    """
+    line_no = 0
+    pos = 0
+    last_line = -1
+    for match in _TME_URL_BYTES_RE.finditer(content):
+        start = match.start()
+        line_no += (content.count(b'\n', pos, start) + content.count(b'\r', pos, start)
+                    - content.count(b'\r\n', pos, start))
+        pos = start
+        for url in _TME_URL_RE.findall(match.group().decode('utf-8')):
+            yield line_no, line_no != last_line, url.rstrip('|)')
+            last_line = line_no
+
+
 def extract_telegram_urls_from_markdown(filepath: str) -> List[str]:
     """Extract Telegram URLs from a markdown file"""
-    urls = []
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'rb') as f:
         content = f.read()
     
-    # Find all t.me URLs
-    pattern = r'https?://t\.me/[^\s\)\]|>]+'
-    matches = re.findall(pattern, content)
+    # Find all t.me URLs, de-duplicated in first-seen order
+    urls = dict.fromkeys(url for _, _, url in _scan_telegram_urls(content))
     
-    for url in matches:
-        url = url.rstrip('|').rstrip(')')
-        if url not in urls:
-            urls.append(url)
+    return list(urls)
+
+
+def extract_telegram_links(filepath: str) -> List[TelegramLink]:
+    """
+    Extract Telegram URLs from a markdown file as parsed TelegramLinks,
+    each recording the lines on which it is the first URL.
+    """
+    with open(filepath, 'rb') as f:
+        content = f.read()
+    
+    first_on_lines = {}
+    for line_no, first, url in _scan_telegram_urls(content):
+        lines = first_on_lines.setdefault(url, [])
+        if first:
+            lines.append(line_no)
     
-    return urls
+    return [make_telegram_link(url, lines) for url, lines in first_on_lines.items()]
 
 
-def update_markdown_with_results(filepath: str, results: List[Dict]) -> int:
+def update_markdown_with_results(filepath: str, results: List[Dict],
+                                 links: Optional[List[TelegramLink]] = None) -> int:
     """
     Update a markdown file with check results.
+    Pass the links from extract_telegram_links to update rows by line number
+    instead of searching every line for a URL.
     Returns the number of rows updated.
     """
     if not results:
@@ -374,114 +815,174 @@ def update_markdown_with_results(filepath: str, results: List[Dict]) -> int:
     # Build lookup by URL
     results_map = {r['url']: r for r in results}
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    line_results = None
+    if links is not None:
+        line_results = {}
+        for link in links:
+            result = results_map.get(link.url)
+            if result is not None:
+                for line_no in link.lines:
+                    line_results[line_no] = result
+    
+    # Stream into a temp file next to the original, then swap it in
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.tmp',
+                                      dir=os.path.dirname(os.path.abspath(filepath)),
+                                      delete=False)
+    try:
+        with open(filepath, 'r', encoding='utf-8') as src, tmp:
+            updated_count = _stream_markdown_updates(src, tmp, results_map,
+                                                     line_results)
+        
+        if updated_count:
+            shutil.copymode(filepath, tmp.name)
+            os.replace(tmp.name, filepath)
+        else:
+            # Nothing changed - leave the original untouched
+            os.remove(tmp.name)
+    except Exception:
+        if os.path.exists(tmp.name):
+            os.remove(tmp.name)
+        raise
     
+    return updated_count
+
+
+def _stream_markdown_updates(src, dst, results_map: Dict[str, Dict],
+                             line_results: Optional[Dict[int, Dict]] = None) -> int:
+    """
+    Copy markdown lines from src to dst, applying check results on the way.
+    With line_results, rows are matched by line number; otherwise by the
+    first Telegram URL on each line.
+    """
     updated_count = 0
-    new_lines = []
     
     # Detect column positions from header
     status_col = None
     members_col = None
+    max_split = 0  # splits needed to isolate the last column we edit
     
-    if lines and '|' in lines[0]:
-        header_parts = [p.strip().lower() for p in lines[0].split('|')]
-        for i, col in enumerate(header_parts):
-            if col == 'status':
-                status_col = i
-            elif col == 'members':
-                members_col = i
-    
-    for line in lines:
-        # Check if this line contains a Telegram URL
-        url_match = re.search(r'(https?://t\.me/[^\s\)\]|>]+)', line)
-        if url_match:
-            url = url_match.group(1).rstrip('|').rstrip(')')
-            if url in results_map:
-                result = results_map[url]
-                status = result.get('status', 'UNKNOWN')
-                members = result.get('members')
-                
-                # Map status to emoji format
-                status_map = {
-                    'ONLINE': '🟢 ONLINE',
-                    'VALID': '🟢 VALID',
-                    'OFFLINE': '🔴 OFFLINE',
-                    'EXPIRED': '🔴 EXPIRED',
-                    'ERROR': '🟡 ERROR',
-                    'FLOOD': '🟡 FLOOD',
-                    'SEIZED': '🔵 SEIZED',
-                }
-                new_status = status_map.get(status, f'⚪ {status}')
-                
-                # Update status and members in line
-                parts = line.split('|')
-                changed = False
-                
-                # Update Status column
-                if status_col and status_col < len(parts):
-                    old_status = parts[status_col].strip()
-                    if old_status != new_status:
-                        parts[status_col] = f' {new_status} '
-                        changed = True
-                
-                # Update Members column
-                if members_col and members_col < len(parts) and members:
-                    members_str = f' {members:,} '
-                    if parts[members_col].strip() != members_str.strip():
-                        parts[members_col] = members_str
-                        changed = True
-                
-                if changed:
-                    line = '|'.join(parts)
-                    updated_count += 1
+    for line_no, line in enumerate(src):
+        if line_no == 0 and '|' in line:
+            header_parts = [p.strip().lower() for p in line.split('|')]
+            for i, col in enumerate(header_parts):
+                if col == 'status':
+                    status_col = i
+                elif col == 'members':
+                    members_col = i
+            max_split = max(status_col or 0, members_col or 0) + 1
         
-        new_lines.append(line)
-    
-    # Always write the file to update members even if status didn't change
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.writelines(new_lines)
+        if line_results is not None:
+            result = line_results.get(line_no)
+        else:
+            # Check if this line contains a Telegram URL; the substring
+            # test skips the regex for prose, headers and separators
+            result = None
+            url_match = _TME_URL_RE.search(line) if 't.me/' in line else None
+            if url_match:
+                url = url_match.group(0).rstrip('|)')
+                result = results_map.get(url)
+        
+        if result is not None and max_split > 1:
+            status = result.get('status', 'UNKNOWN')
+            members = result.get('members')
+            
+            # Map status to emoji format
+            new_status = STATUS_LABELS.get(status) or f'⚪ {status}'
+            
+            # Update status and members in line; the tail stays unsplit
+            parts = line.split('|', max_split)
+            changed = False
+            
+            # Update Status column
+            if status_col and status_col < len(parts):
+                old_status = parts[status_col].strip()
+                if old_status != new_status:
+                    parts[status_col] = f' {new_status} '
+                    changed = True
+            
+            # Update Members column
+            if members_col and members_col < len(parts) and members:
+                members_str = f' {members:,} '
+                if parts[members_col].strip() != members_str.strip():
+                    parts[members_col] = members_str
+                    changed = True
+            
+            if changed:
+                line = '|'.join(parts)
+                updated_count += 1
+        
+        dst.write(line)
     
     return updated_count
 
 
-def print_results_summary(results: List[Dict]):
+class ResultsSummary:
+    """
+    Accumulates what print_results_summary shows, one result at a time:
+    per-status counts, a few sample URLs and the 10 largest channels.
+    """
+    DETAIL_STATUSES = ('OFFLINE', 'EXPIRED', 'ERROR')
+    SAMPLES = 5
+    TOP = 10
+
+    def __init__(self):
+        self.counts = Counter()
+        self.samples: Dict[str, List[str]] = {}
+        self.with_members = 0
+        self._top = []  # min-heap of (members, -seen, result)
+        self._seen = 0
+
+    def add(self, result: Dict):
+        status = result.get('status', 'UNKNOWN')
+        self.counts[status] += 1
+        if status in self.DETAIL_STATUSES:
+            samples = self.samples.setdefault(status, [])
+            if len(samples) < self.SAMPLES:
+                samples.append(result['url'])
+        
+        if result.get('members'):
+            self.with_members += 1
+            # -seen keeps the earliest of equal counts, like heapq.nlargest
+            entry = (result['members'], -self._seen, result)
+            if len(self._top) < self.TOP:
+                heapq.heappush(self._top, entry)
+            else:
+                heapq.heappushpop(self._top, entry)
+        self._seen += 1
+
+    def print(self):
+        print("\n" + "=" * 60)
+        print("📊 CHECK RESULTS SUMMARY")
+        print("=" * 60)
+        
+        for status, count in sorted(self.counts.items()):
+            emoji = STATUS_EMOJI.get(status, '⚪')
+            print(f"\n{emoji} {status}: {count}")
+            
+            # Show details for offline/expired
+            if status in self.DETAIL_STATUSES:
+                for url in self.samples[status]:
+                    print(f"   - {url[:50]}...")
+                if count > self.SAMPLES:
+                    print(f"   ... and {count - self.SAMPLES} more")
+        
+        # Show channels with member counts
+        if self.with_members:
+            print(f"\n👥 Channels with member info: {self.with_members}")
+            for _, _, r in sorted(self._top, reverse=True):
+                title = r.get('title', 'Unknown')[:30]
+                members = r.get('members', 0)
+                print(f"   {members:,} members - {title}")
+        
+        print("\n" + "=" * 60)
+
+
+def print_results_summary(results: Iterable[Dict]):
     """Print a detailed summary of check results"""
-    print("\n" + "=" * 60)
-    print("📊 CHECK RESULTS SUMMARY")
-    print("=" * 60)
-    
-    # Group by status
-    by_status = {}
+    summary = ResultsSummary()
     for r in results:
-        s = r.get('status', 'UNKNOWN')
-        if s not in by_status:
-            by_status[s] = []
-        by_status[s].append(r)
-    
-    for status, items in sorted(by_status.items()):
-        emoji = {'ONLINE': '🟢', 'VALID': '🟢', 'OFFLINE': '🔴', 'EXPIRED': '🔴', 
-                 'ERROR': '🟡', 'FLOOD': '🟡', 'SEIZED': '🔵'}.get(status, '⚪')
-        print(f"\n{emoji} {status}: {len(items)}")
-        
-        # Show details for offline/expired
-        if status in ['OFFLINE', 'EXPIRED', 'ERROR']:
-            for item in items[:5]:  # Show first 5
-                print(f"   - {item['url'][:50]}...")
-            if len(items) > 5:
-                print(f"   ... and {len(items) - 5} more")
-    
-    # Show channels with member counts
-    with_members = [r for r in results if r.get('members')]
-    if with_members:
-        print(f"\n👥 Channels with member info: {len(with_members)}")
-        top_10 = sorted(with_members, key=lambda x: x.get('members', 0), reverse=True)[:10]
-        for r in top_10:
-            title = r.get('title', 'Unknown')[:30]
-            members = r.get('members', 0)
-            print(f"   {members:,} members - {title}")
-    
-    print("\n" + "=" * 60)
+        summary.add(r)
+    summary.print()
 
 
 def dry_run_check(url: str) -> Dict:
@@ -507,15 +1008,37 @@ def dry_run_check(url: str) -> Dict:
     return result
 
 
+def dry_run_markdown_files(filepaths: List[str], output_file: Optional[str] = None):
+    """Dry-run each file's URLs, printing a summary per file and streaming results to output_file"""
+    with JsonArrayWriter(output_file) if output_file else nullcontext() as out:
+        for filepath in filepaths:
+            urls = extract_telegram_urls_from_markdown(filepath)
+            print(f"📋 Found {len(urls)} Telegram URLs in {filepath}")
+            summary = ResultsSummary()
+            for url in urls:
+                result = dry_run_check(url)
+                summary.add(result)
+                if out:
+                    out.write(result)
+            
+            # Print detailed summary
+            summary.print()
+    
+    if output_file:
+        print(f"📁 Results saved to {output_file}")
+
+
 def main():
     parser = argparse.ArgumentParser(description='Telegram Channel Monitor')
     parser.add_argument('--setup', action='store_true', help='Setup session (interactive)')
     parser.add_argument('--export-session', action='store_true', help='Export session as base64')
-    parser.add_argument('--check', type=str, help='Check URLs from markdown file')
+    parser.add_argument('--check', type=str, nargs='+', metavar='FILE',
+                        help='Check URLs from markdown file(s), sharing one connection')
     parser.add_argument('--url', type=str, help='Check single URL')
     parser.add_argument('--output', type=str, help='Output JSON file')
     parser.add_argument('--dry-run', action='store_true', help='Test URL parsing without Telegram connection')
     parser.add_argument('--validate-session', action='store_true', help='Validate session file/env var')
+    parser.add_argument('--no-cache', action='store_true', help=f'Ignore and do not update {CACHE_FILE}')
     
     args = parser.parse_args()
     
@@ -546,14 +1069,12 @@ def main():
                 # Try to connect
                 if API_ID and API_HASH:
                     async def test_connect():
-                        client = TelegramClient(SESSION_NAME, int(API_ID), API_HASH)
-                        await client.connect()
-                        if await client.is_user_authorized():
-                            me = await client.get_me()
-                            print(f"✅ Connected as: {me.first_name} (@{me.username})")
-                        else:
-                            print("❌ Session exists but user not authorized")
-                        await client.disconnect()
+                        async with TelegramMonitor(use_cache=False) as monitor:
+                            if await monitor.is_authorized():
+                                me = await monitor.client.get_me()
+                                print(f"✅ Connected as: {me.first_name} (@{me.username})")
+                            else:
+                                print("❌ Session exists but user not authorized")
                     asyncio.run(test_connect())
             else:
                 print("❌ Session validation failed")
@@ -565,35 +1086,23 @@ def main():
                 print(f"❌ No local session file: {SESSION_FILE}")
     
     elif args.check:
-        urls = extract_telegram_urls_from_markdown(args.check)
-        print(f"📋 Found {len(urls)} Telegram URLs in {args.check}")
-        
         if args.dry_run:
-            results = [dry_run_check(url) for url in urls]
-            if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(results, f, indent=2)
-                print(f"📁 Results saved to {args.output}")
+            dry_run_markdown_files(args.check, args.output)
         else:
-            results = asyncio.run(run_checks(urls, args.output))
-            
-            # Update the markdown file with results
-            updated = update_markdown_with_results(args.check, results)
-            if updated:
-                print(f"✏️  Updated {updated} entries in {args.check}")
-        
-        # Print detailed summary
-        print_results_summary(results)
+            # One connection for every file
+            asyncio.run(check_markdown_files(args.check, args.output,
+                                             use_cache=not args.no_cache))
     
     elif args.url:
         if args.dry_run:
             result = dry_run_check(args.url)
             if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump([result], f, indent=2)
+                with open(args.output, 'wb') as f:
+                    f.write(_json_bytes([result]))
             print(json.dumps(result, indent=2))
         else:
-            results = asyncio.run(run_checks([args.url], args.output))
+            results = asyncio.run(run_checks([args.url], args.output,
+                                             use_cache=not args.no_cache))
             if results:
                 print(json.dumps(results[0], indent=2))
     